@@ -952,20 +952,22 @@ class Block:
     def indented_str(self, indent: Optional[str] = None, print_attr: Optional[bool] = False) -> str:
         if indent is None:
             indent = ""
-        s = (
+        # Accumulate in a list and join once: repeated += on long program
+        # strings is quadratic.
+        parts = [
             indent
             + self.name
             + "("
             + ", ".join([str(var) for var in self._block_inputs])
-        )
-        s += ") {\n"
+            + ") {\n"
+        ]
         for op in self.operations:
-            s += op.indented_str(indent + SPACES * 1, print_attr=print_attr)
-        s += indent + "} -> ("
+            parts.append(op.indented_str(indent + SPACES * 1, print_attr=print_attr))
+        parts.append(indent + "} -> (")
         if self._outputs is not None:
-            s += ", ".join(["%" + v.name for v in self._outputs])
-        s += ")\n"
-        return s
+            parts.append(", ".join(["%" + v.name for v in self._outputs]))
+        parts.append(")\n")
+        return "".join(parts)
 
     def __repr__(self):
         return self.__str__()
@@ -37,6 +37,7 @@ class InputSpec:
         self._ordered_dict = OrderedDict()
         for k, v in self._input_types:
             self._ordered_dict[k] = v
+        self._validator = None
 
     def __add__(self, input_spec):
         new_order_dict = {k: v for k, v in self._ordered_dict.items()}
@@ -80,60 +81,83 @@ class InputSpec:
         Raise:
             ValueErrr if value type is incompatible
         """
-        msg_prefix = 'Op \"{}\" (op_type: {}) '.format(op_name, op_type)
+        if self._validator is None:
+            self._validator = self._compile_validator()
+        self._validator(op_name, op_type, candidate_kvs)
 
-        # check vars sharing the same type_domain_id have the same dtype
-        type_domain_group = {}
-        var_to_input_name = {}
-        for name, var in candidate_kvs.items():
-            input_type = self.input_types[name]
+    def _compile_validator(self):
+        """
+        Builds a validator specialized to this spec. The per-name dispatch
+        (which InputType subclass a name binds to, whether constness and
+        type-domain checks apply) is resolved here once, so validate_inputs
+        only performs the checks that can actually vary per call.
+        """
+        # name -> type_domain_id, for names participating in a type domain
+        domain_id_by_name = {}
+        # name -> (input_type, needs constness check)
+        check_by_name = {}
+        for name, input_type in self._ordered_dict.items():
             if isinstance(input_type, TensorInputType) and input_type.type_domain_id is not None:
-                type_domain_id = input_type.type_domain_id
-                if type_domain_id in type_domain_group:
-                    type_domain_group[type_domain_id].append(var)
-                else:
-                    type_domain_group[type_domain_id] = [var]
-                var_to_input_name[var] = name
-
-        for type_domain_id, vars in type_domain_group.items():
-            expected_dtype = vars[0].dtype
-            ref_name = var_to_input_name[vars[0]]
-            for var in vars:
-                name = var_to_input_name[var]
-                if not var.dtype == expected_dtype:
-                    msg = (
-                        "In op, of type {}, named {}, the named input `{}` must have the same data type "
-                        "as the named input `{}`. However, {} has dtype {} whereas {} has dtype {}."
-                    ).format(op_type, op_name, name, ref_name, name,
-                             var.dtype.__type_info__(), ref_name, expected_dtype.__type_info__())
-                    raise ValueError(msg)
-
-        # Ensure candidate_kvs doesn't contain None
-        for name, var in candidate_kvs.items():
-            if var is None:
-                raise ValueError(msg_prefix + 'Input {} is None'.format(name))
-
-            if name not in self.input_types:
-                raise ValueError(msg_prefix + \
-                    'Unrecognized input {}'.format(name))
-
-            input_type = self.input_types[name]
-            # Check constness
-            # Don't check InternalInputType (so _const_symbolic can work)
-            if (
-                input_type.const
-                and not isinstance(input_type, InternalInputType)
-                and not var.is_descendant_of_const
-            ):
-                msg = msg_prefix + "Input {} must be const at compile time"
-                raise ValueError(msg.format(name), name, var.name)
-
-            if not isinstance(var, InternalVar) and \
-                not input_type.is_compatible(var):
-                msg = msg_prefix + "Input {}=\"{}\" expects " +\
-                        "{} but got {}"
-                raise ValueError(msg.format(name, var.name, input_type.type_str,
-                            var.sym_type.__type_info__()))
+                domain_id_by_name[name] = input_type.type_domain_id
+            # Don't check constness of InternalInputType (so _const_symbolic can work)
+            check_by_name[name] = (
+                input_type,
+                input_type.const and not isinstance(input_type, InternalInputType),
+            )
+
+        def validator(op_name, op_type, candidate_kvs):
+            msg_prefix = 'Op \"{}\" (op_type: {}) '.format(op_name, op_type)
+
+            # check vars sharing the same type_domain_id have the same dtype
+            if domain_id_by_name:
+                type_domain_group = {}
+                var_to_input_name = {}
+                for name, var in candidate_kvs.items():
+                    type_domain_id = domain_id_by_name.get(name)
+                    if type_domain_id is not None:
+                        if type_domain_id in type_domain_group:
+                            type_domain_group[type_domain_id].append(var)
+                        else:
+                            type_domain_group[type_domain_id] = [var]
+                        var_to_input_name[var] = name
+
+                for type_domain_id, vars in type_domain_group.items():
+                    expected_dtype = vars[0].dtype
+                    ref_name = var_to_input_name[vars[0]]
+                    for var in vars:
+                        name = var_to_input_name[var]
+                        if not var.dtype == expected_dtype:
+                            msg = (
+                                "In op, of type {}, named {}, the named input `{}` must have the same data type "
+                                "as the named input `{}`. However, {} has dtype {} whereas {} has dtype {}."
+                            ).format(op_type, op_name, name, ref_name, name,
+                                     var.dtype.__type_info__(), ref_name, expected_dtype.__type_info__())
+                            raise ValueError(msg)
+
+            # Ensure candidate_kvs doesn't contain None
+            for name, var in candidate_kvs.items():
+                if var is None:
+                    raise ValueError(msg_prefix + 'Input {} is None'.format(name))
+
+                checks = check_by_name.get(name)
+                if checks is None:
+                    raise ValueError(msg_prefix + \
+                        'Unrecognized input {}'.format(name))
+
+                input_type, check_const = checks
+                # Check constness
+                if check_const and not var.is_descendant_of_const:
+                    msg = msg_prefix + "Input {} must be const at compile time"
+                    raise ValueError(msg.format(name), name, var.name)
+
+                if not isinstance(var, InternalVar) and \
+                    not input_type.is_compatible(var):
+                    msg = msg_prefix + "Input {}=\"{}\" expects " +\
+                            "{} but got {}"
+                    raise ValueError(msg.format(name, var.name, input_type.type_str,
+                                var.sym_type.__type_info__()))
+
+        return validator
 
 
 class _InputType:
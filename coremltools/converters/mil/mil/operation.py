@@ -3,6 +3,7 @@
 #  Use of this source code is governed by a BSD-3-clause license that can be
 #  found in the LICENSE.txt file or at https://opensource.org/licenses/BSD-3-Clause
 
+import types as _python_types
 from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
@@ -20,6 +21,52 @@ SYMBOL = 2
 NONE = 4
 ALL = 7
 
+# Flag names indexed by bit position (VALUE = 1 << 0, SYMBOL = 1 << 1,
+# NONE = 1 << 2).
+_FLAG_NAMES = ("VALUE", "SYMBOL", "NONE")
+
+
+def _raise_disallowed_input(op_type, flag):
+    msg = "Implementation of value_inference() for op {} doesn't support input with {}"
+    raise NotImplementedError(msg.format(op_type, _FLAG_NAMES[flag.bit_length() - 1]))
+
+# numba is an optional dependency: when available, the all-numeric fast path
+# of _is_compatible_symbolic_array runs as a native early-exit loop.
+_HAS_NUMBA = True
+try:
+    from numba import njit as _njit
+except:
+    _njit = None
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+
+    @_njit(cache=True)
+    def _compat_numeric(a, b):
+        for i in range(a.size):
+            if a[i] != b[i]:
+                return False
+        return True
+
+
+# kwargs to Operation.__init__ that are not op inputs (see
+# Operation._check_expected_inputs).
+_NON_ATTRIBUTE_KWARGS = frozenset(
+    {
+        "name",
+        "symbolic_datatype",
+        "datatype",
+        "symbolic_value",
+        "value",
+        "version",
+        "before_op",
+        "no_check_var_types",
+        # no_check_var_types==True to force set inputs, even if type does not match with earlier ones
+        "enclosing_block",
+        "scopes",
+    }
+)
+
 
 def _is_compatible_symbolic_array(a, b):
     """
@@ -33,13 +80,31 @@ def _is_compatible_symbolic_array(a, b):
     """
     if not a.shape == b.shape:
         return False
-    a = a.flatten()
-    b = b.flatten()
-    for t, v in zip(a, b):
-        if not is_symbolic(t) and not is_symbolic(v):
-            if t != v:
-                return False
-    return True
+    a = a.ravel()
+    b = b.ravel()
+    if a.dtype.kind in "biufc" and b.dtype.kind in "biufc":
+        # Numeric arrays cannot hold symbols; compare in native code.
+        if _HAS_NUMBA and a.dtype == b.dtype:
+            return bool(_compat_numeric(a, b))
+        return bool(np.array_equal(a, b))
+    sym_a = np.frompyfunc(is_symbolic, 1, 1)(a).astype(bool)
+    sym_b = np.frompyfunc(is_symbolic, 1, 1)(b).astype(bool)
+    concrete = ~(sym_a | sym_b)
+    return bool(np.all(a[concrete] == b[concrete]))
+
+
+def _values_differ(x, y):
+    """
+    A helper function which checks if two value-inference results differ.
+    Symbolic entries in object arrays are treated as compatible with anything
+    (see _is_compatible_symbolic_array). Unlike `np.any(x != y)`, no full
+    boolean difference array is materialized for numeric tensors.
+    """
+    if not isinstance(x, np.ndarray) or not isinstance(y, np.ndarray):
+        return bool(np.any(x != y))
+    if x.shape != y.shape:
+        return True
+    return not _is_compatible_symbolic_array(x, y)
 
 
 def precondition(allow=ALL):
@@ -62,53 +127,51 @@ def precondition(allow=ALL):
     def value_inference(self):
         '''some value_inference implementation'''
     """
-    ALLOW_VALUE = allow & VALUE
-    ALLOW_SYMBOL = allow & SYMBOL
-    ALLOW_NONE = allow & NONE
+    disallow = ALL & ~allow
 
-    def process(v, has_value, has_symbol, has_none):
+    def process(v, op_type):
         """
         v: Var
 
-        Return updated has_value, has_symbol, has_none
+        Raises NotImplementedError if v is disallowed by the precondition.
         """
         if any_symbolic(v.sym_val):
-            return has_value, True, has_none
+            flag = SYMBOL
         elif v.val is None:
-            return has_value, has_symbol, True
-        return True, has_symbol, has_none
+            flag = NONE
+        else:
+            flag = VALUE
+        if flag & disallow:
+            _raise_disallowed_input(op_type, flag)
 
     def decorator(func):
-        def wrapper(self):
-            HAS_VALUE = False
-            HAS_SYMBOL = False
-            HAS_NONE = False
-            for in_name, in_type in self._input_types.items():
-                if in_type.optional:
-                    # Optional inputs are not required to invoke value_inference()
-                    continue
+        if not disallow:
+            # Every input kind is allowed; there is nothing to enforce.
+            return func
+        # The set of required (non-optional) inputs and their tuple-ness is
+        # fixed per op class, so compute the (name, is_tuple) pairs once per
+        # class instead of re-walking _input_types.items() on every call.
+        required_input_plans = {}
 
-                if isinstance(in_type, TupleInputType):
+        def wrapper(self):
+            cls = type(self)
+            plan = required_input_plans.get(cls)
+            if plan is None:
+                plan = [
+                    (in_name, isinstance(in_type, TupleInputType))
+                    for in_name, in_type in self._input_types.items()
+                    if not in_type.optional
+                ]
+                required_input_plans[cls] = plan
+
+            op_type = self.op_type
+            for in_name, is_tuple in plan:
+                if is_tuple:
                     for v in self._input_vars[in_name]:
-                        HAS_VALUE, HAS_SYMBOL, HAS_NONE = process(
-                            v, HAS_VALUE, HAS_SYMBOL, HAS_NONE
-                        )
+                        process(v, op_type)
                 else:
-                    HAS_VALUE, HAS_SYMBOL, HAS_NONE = process(
-                        self._input_vars[in_name], HAS_VALUE, HAS_SYMBOL, HAS_NONE
-                    )
-
-            if HAS_VALUE and not ALLOW_VALUE:
-                msg = "Implementation of value_inference() for op {} doesn't support input with VALUE"
-                raise NotImplementedError(msg.format(self.op_type))
-            elif HAS_SYMBOL and not ALLOW_SYMBOL:
-                msg = "Implementation of value_inference() for op {} doesn't support input with SYMBOL"
-                raise NotImplementedError(msg.format(self.op_type))
-            elif HAS_NONE and not ALLOW_NONE:
-                msg = "Implementation of value_inference() for op {} doesn't support input with NONE"
-                raise NotImplementedError(msg.format(self.op_type))
-            else:
-                return func(self)
+                    process(self._input_vars[in_name], op_type)
+            return func(self)
 
         return wrapper
 
@@ -124,6 +187,8 @@ class mil_list:
     A wrapper around python list
     """
 
+    __slots__ = ["ls"]
+
     def __init__(self, ls=None):
         self.ls = ls if ls is not None else []
         if not isinstance(self.ls, list):
@@ -155,43 +220,100 @@ class Operation:
         List of output var based on type inference. Read-only
     """
 
+    # Like Var, ops are created in bulk (one per node of the graph), so per
+    # instance dict overhead adds up. Subclasses that set extra instance
+    # attributes (e.g. const's _weight_id) fall back to a lazily created
+    # __dict__ since they don't declare __slots__ themselves.
+    __slots__ = [
+        "name",
+        "_output_vars",
+        "_input_vars",
+        "_inputs_cache",
+        "_internal_inputs_cache",
+        "blocks",
+        "enclosing_block",
+        "scopes",
+    ]
+
     # Map from type domain id to a tuple of accepted types.
     type_domains: Dict[str, Tuple[Any]] = dict()
 
+    # True if the class overrides value_inference (see __init_subclass__).
+    _has_value_inference = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Resolved once at class-definition time, so _auto_val doesn't pay for
+        # calling and catching the raising base-class method on every op that
+        # doesn't implement value_inference.
+        cls._has_value_inference = cls.value_inference is not Operation.value_inference
+
     @classmethod
     def supported_dtypes(cls):
-        return [builtin_to_string(v) for v in cls.type_domains["T"]]
+        if "_supported_dtypes" not in cls.__dict__:
+            cls._supported_dtypes = [builtin_to_string(v) for v in cls.type_domains["T"]]
+        return cls._supported_dtypes
+
+    @classmethod
+    def _get_resolved_input_types(cls):
+        """
+        Returns a read-only view of ``input_spec.input_types`` with type_domains
+        populated into the input types. The result is computed once per op class
+        and cached as a class attribute (like ``_op_variants``), so op
+        construction doesn't need to re-resolve type domains per instance.
+        """
+        if "_input_types" not in cls.__dict__:
+            input_types = cls.input_spec.input_types
+            for v in input_types.values():
+                if not isinstance(v, TensorInputType):
+                    continue
+                if len(v.type_domain) == 0:
+                    if v.type_domain_id not in cls.type_domains:
+                        raise ValueError("type_domain {} not defined.".format(v.type_domain_id))
+                    v.type_domain = cls.type_domains[v.type_domain_id]
+            cls._input_types = _python_types.MappingProxyType(input_types)
+        return cls.__dict__["_input_types"]
+
+    @classmethod
+    def _get_tuple_input_names(cls):
+        """
+        Names of the inputs declared as TupleInputType, cached per op class.
+        Only these inputs hold python lists / tuples of Vars, so callers can
+        dispatch on the input name instead of the value type.
+        """
+        if "_tuple_input_names" not in cls.__dict__:
+            cls._tuple_input_names = frozenset(
+                name
+                for name, input_type in cls._get_resolved_input_types().items()
+                if isinstance(input_type, TupleInputType)
+            )
+        return cls.__dict__["_tuple_input_names"]
 
     def __init__(self, **kwargs):
-        self._input_types = self.input_spec.input_types
-        self._type_domains = self.type_domains
+        type(self)._get_resolved_input_types()
         self.name = kwargs.get("name", None)
 
         self._output_vars = None
         self._input_vars = {}
+        self._inputs_cache = None
+        self._internal_inputs_cache = None
         self.blocks = []
         self.enclosing_block = kwargs["enclosing_block"]
         self.scopes = kwargs["scopes"]
 
-        # Initialize inputs as object attributes (all None)
+        # Initialize input slots (all None) and collect the op inputs supplied
+        # via kwargs, touching each input name exactly once. Iterating the
+        # (small) input spec avoids scanning the system kwargs.
+        input_kv = {}
         for k in self._input_types.keys():
-            setattr(self, k, None)
             self._input_vars[k] = None
+            v = kwargs.get(k)
+            if v is not None:
+                input_kv[k] = v
 
         self._check_expected_inputs(kwargs)
 
-        # Populate type_domains into input types
-        for v in self._input_types.values():
-            if not isinstance(v, TensorInputType):
-                continue
-            if len(v.type_domain) == 0:
-                if v.type_domain_id not in self._type_domains:
-                    raise ValueError("type_domain {} not defined.".format(v.type_domain_id))
-                v.type_domain = self._type_domains[v.type_domain_id]
-
         # Set inputs from kwargs
-        input_kv = {k: v for k, v in kwargs.items()
-                    if k in self._input_types and v is not None}
         self._validate_and_set_inputs(input_kv)
         self._ensure_required_inputs()
 
@@ -202,21 +324,8 @@ class Operation:
         - system inputs (non-attributes)
         - op inputs (self._input_types.keys())
         """
-        non_attributes = [
-            "name",
-            "symbolic_datatype",
-            "datatype",
-            "symbolic_value",
-            "value",
-            "version",
-            "before_op",
-            "no_check_var_types",
-            # no_check_var_types==True to force set inputs, even if type does not match with earlier ones
-            "enclosing_block",
-            "scopes",
-        ]
         for k in kwargs.keys():
-            if k not in non_attributes and k not in self._input_types:
+            if k not in _NON_ATTRIBUTE_KWARGS and k not in self._input_types:
                 raise ValueError(
                     "Unknown input '{}' for op '{}'".format(k, self.op_type)
                 )
@@ -241,9 +350,12 @@ class Operation:
         Returns:
         list[Var]. Flatten all tuple inputs
         """
+        tuple_input_names = type(self)._get_tuple_input_names()
+        if not tuple_input_names:
+            return list(self.inputs.values())
         flat_inputs = []
-        for v in self.inputs.values():
-            if isinstance(v, (list, tuple)):
+        for k, v in self.inputs.items():
+            if k in tuple_input_names:
                 flat_inputs.extend(v)
             else:
                 flat_inputs.append(v)
@@ -263,15 +375,17 @@ class Operation:
         if not isinstance(output_types, tuple):
             output_types = (output_types,)
         output_vals = self._auto_val(output_types)
-        try:
+        # Almost no op class implements output_names(), so check for an
+        # override per class instead of paying for a raised and caught
+        # NotImplementedError on every call.
+        if type(self).output_names is not Operation.output_names:
             output_names = self.output_names()
             if not isinstance(output_names, tuple):
                 output_names = (output_names,)
-        except NotImplementedError:
-            if len(output_types) > 1:
-                output_names = tuple(str(i) for i, _ in enumerate(output_types))
-            else:
-                output_names = ("",)  # output name same as op name.
+        elif len(output_types) > 1:
+            output_names = tuple(str(i) for i, _ in enumerate(output_types))
+        else:
+            output_names = ("",)  # output name same as op name.
 
         # Combine (output_names, output_types, output_vals) to create output
         # Vars.
@@ -343,16 +457,17 @@ class Operation:
                     out_var._sym_val = sym_val
 
                 if sym_val is not None and out_var.sym_val is not None:
-                    if np.any(sym_val.val != out_var.sym_val):
+                    if _values_differ(sym_val.val, out_var.sym_val):
                         if overwrite_output:
                             out_var._sym_val = sym_val
                         else:
                             msg = 'value_inference differs for var {} in op {}'
-                            if not _is_compatible_symbolic_array(sym_val.val, out_var.sym_val):
-                                raise ValueError(msg.format(out_var.name, self.name))
+                            raise ValueError(msg.format(out_var.name, self.name))
 
-                for o in self.outputs:
-                    o._set_nonreplaceable_vars_upstream()
+            # Re-propagate after all outputs are updated; doing this inside the
+            # loop above would redundantly walk upstream once per output pair.
+            for o in self.outputs:
+                o._set_nonreplaceable_vars_upstream()
 
     def _auto_val(self, output_types):
         """
@@ -378,14 +493,18 @@ class Operation:
         Returns:
             output_vals: tuple of builtin type with value, or tuple of None
         """
+        if not type(self)._has_value_inference:
+            # value_inference() is not implemented by this op class.
+            return tuple(None for _ in output_types)
+
         do_auto_val = True
 
-        if do_auto_val:
-            # Is self.value_inference implemented for corresponding input?
-            try:
-                vals = self.value_inference()
-            except NotImplementedError:
-                do_auto_val = False
+        # Is self.value_inference implemented for corresponding input?
+        try:
+            vals = self.value_inference()
+        except NotImplementedError:
+            # e.g. a @precondition rejected the input kinds.
+            do_auto_val = False
 
         if not do_auto_val:
             # No auto_val possible.
@@ -514,12 +633,15 @@ class Operation:
 
         self.input_spec.validate_inputs(self.name, self.op_type, input_kvs)
 
+        tuple_input_names = type(self)._get_tuple_input_names()
         for name, var in input_kvs.items():
+            is_tuple_input = name in tuple_input_names
+
             # Remove this operation itself from existing input
             # Var's child_ops
             existing_input_var = self._input_vars[name]
             if existing_input_var is not None:
-                if isinstance(existing_input_var, (list, tuple)):
+                if is_tuple_input:
                     for v_old, v_new in zip(existing_input_var, var):
                         check_and_detach(v_new, v_old, self, no_check_var_types)
                 else:
@@ -528,16 +650,25 @@ class Operation:
                     )
 
             # Set var as input_var
-            if isinstance(var, Var):
+            if is_tuple_input:
+                for v in var:
+                    v.add_child_op(self)
+            elif isinstance(var, Var):
                 # TODO: the child op of complex op's input might get lost, as the complex op will
                 # be lowered. Maybe should add child op here and take care of it in lowering pass.
                 var.add_child_op(self)
-            elif isinstance(var, (tuple, list)):
-                for v in var:
-                    v.add_child_op(self)
             # ignore function inputs
             self._input_vars[name] = var
-            setattr(self, name, var)
+
+        self._invalidate_input_caches()
+
+    def _invalidate_input_caches(self):
+        """
+        Drops the cached `inputs` / `internal_inputs` dicts. Must be called
+        whenever `_input_vars` is mutated.
+        """
+        self._inputs_cache = None
+        self._internal_inputs_cache = None
 
     @property
     def inputs(self):
@@ -546,19 +677,27 @@ class Operation:
         -------
         - inputs: Dict[str, Union[Var, Tuple[Var]]]
         """
-        # Filter out InternalVar
-        return {
-            k: v
-            for k, v in self._input_vars.items()
-            if not isinstance(v, InternalVar) and v is not None
-        }
+        if self._inputs_cache is None:
+            # Filter out InternalVar
+            self._inputs_cache = {
+                k: v
+                for k, v in self._input_vars.items()
+                if not isinstance(v, InternalVar) and v is not None
+            }
+        # Copy so that callers mutating the returned dict (e.g. to build the
+        # kwargs of a replacement op) cannot corrupt the cache.
+        return dict(self._inputs_cache)
 
     @property
     def internal_inputs(self) -> Dict[str, InternalVar]:
         """
         Get internal var inputs of an op.
         """
-        return {k: v for k, v in self._input_vars.items() if isinstance(v, InternalVar)}
+        if self._internal_inputs_cache is None:
+            self._internal_inputs_cache = {
+                k: v for k, v in self._input_vars.items() if isinstance(v, InternalVar)
+            }
+        return dict(self._internal_inputs_cache)
 
     @property
     def outputs(self):
@@ -570,6 +709,12 @@ class Operation:
 
     @property
     def opset_version(self):
+        # Registration records the version (see SSAOpRegistry.register_op);
+        # fall back to scanning _op_variants for op classes that were not
+        # registered as core ops.
+        version = getattr(type(self), "_cached_opset_version", None)
+        if version is not None:
+            return version
         op_variants = type(self)._op_variants
         opset_versions = sorted(list(op_variants.keys()))
         for i in opset_versions:
@@ -587,42 +732,65 @@ class Operation:
     def var_to_str(v):
         if isinstance(v, (tuple, list)):
             return "(" + ", ".join(["%" + s.name for s in v]) + ")"
-        elif v.op and v.op.op_type == "const":
+        if v._str_repr_cache is not None:
+            return v._str_repr_cache
+        if v.op and v.op.op_type == "const":
             val = v.op.val.sym_val
             if isinstance(val, (np.generic, np.ndarray)):
                 # for small tensors, serialize as string; skip large tensors.
                 if val.size <= 10:
-                    return str(val.tolist())
+                    v._str_repr_cache = str(val.tolist())
+                    return v._str_repr_cache
             else:
                 # other types are small enough they can be serialized
-                return (
+                v._str_repr_cache = (
                     '"' + val + '"'
                     if isinstance(val, str)
                     else str(val)
                 )
+                return v._str_repr_cache
 
+        # Not cached: var names can be renamed after creation.
         return "%" + v.name
 
     def indented_str(self, indent: Optional[str] = "", print_attr: Optional[bool] = False) -> str:
         if self.op_type == "const":
             return ""
-        s = indent
+        # Accumulate in a list and join once: repeated += on long program
+        # strings is quadratic.
+        parts = [indent]
         if self.outputs is not None:
-            s += ", ".join([str(o) for o in self.outputs])
+            parts.append(", ".join([str(o) for o in self.outputs]))
 
         if print_attr:
-            attr = "["
-            attr += ", ".join([f"{k}: {v}" for k, v in self.scopes.items()])
-            attr += "]"
+            attr = "[" + ", ".join([f"{k}: {v}" for k, v in self.scopes.items()]) + "]"
         else:
             attr = ""
 
-        s += " = " + self.op_type + attr + "("
-        s += ", ".join([k + "=" + Operation.var_to_str(v) for k, v in self.inputs.items()])
-        s += ', name="{}")\n'.format(self.name)
+        parts.append(" = " + self.op_type + attr + "(")
+        parts.append(", ".join([k + "=" + Operation.var_to_str(v) for k, v in self.inputs.items()]))
+        parts.append(', name="{}")\n'.format(self.name))
         for b in self.blocks:
-            s += b.indented_str(indent=indent + SPACES, print_attr=print_attr)
-        return s
+            parts.append(b.indented_str(indent=indent + SPACES, print_attr=print_attr))
+        return "".join(parts)
+
+    def __getattr__(self, name):
+        # Inputs live only in _input_vars; there is no mirrored instance
+        # attribute per input. This is invoked only when normal attribute
+        # lookup fails, so ordinary attribute access pays nothing for it.
+        if name == "_input_vars":
+            # Guard against recursion when lookup happens before __init__
+            # has populated the instance (e.g. during copy / pickle).
+            raise AttributeError(name)
+        try:
+            input_vars = self._input_vars
+        except AttributeError:
+            raise AttributeError(name)
+        if name in input_vars:
+            return input_vars[name]
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(type(self).__name__, name)
+        )
 
     def __repr__(self):
         return str(self)
@@ -457,7 +457,10 @@ class while_loop(Operation):
         for v in block_inputs:
             v._op = None
             v.op_output_idx = None
-            v._child_ops = list()
+            v._child_ops = dict()
+            # The shallow copy shares the cached repr of the loop var; the
+            # block input is no longer const-backed, so it must print as %name.
+            v._str_repr_cache = None
 
             # Get unique name
 
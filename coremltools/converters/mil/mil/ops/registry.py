@@ -159,6 +159,14 @@ class SSAOpRegistry:
             # add the version information to the op cls
             op_cls._op_variants = op_reg[op_type]
 
+            # Core ops are registered oldest version first, so the first
+            # registration of a class is its minimum supported opset version.
+            # Recording it here gives Operation.opset_version an O(1) lookup
+            # instead of scanning the sorted _op_variants keys per access.
+            if not is_custom_op and not is_dialect_op:
+                if "_cached_opset_version" not in op_cls.__dict__:
+                    op_cls._cached_opset_version = opset_version
+
             @classmethod
             def add_op(cls, **kwargs):
                 """
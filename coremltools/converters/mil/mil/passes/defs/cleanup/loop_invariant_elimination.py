@@ -146,10 +146,10 @@ class loop_invariant_elimination(AbstractGraphPass):
             for i in loop_invariant_ids:
                 op.loop_vars[i].remove_child_op(op)
 
-            op.loop_vars = tuple(
+            op._input_vars["loop_vars"] = tuple(
                 v for i, v in enumerate(op.loop_vars) if i not in loop_invariant_ids
             )
-            op._input_vars["loop_vars"] = op.loop_vars
+            op._invalidate_input_caches()
 
             # remove invariants from while_loop body_block outputs
             body_block = op.blocks[1]
@@ -310,7 +310,7 @@ class CastTypeQuantization(AbstractQuantizationPass):
 
                     inputs_modified = True
                     casted_var_name = f"{var.name}_to_{param_target_dtype}"
-                    if len(var._child_ops) > 1 and casted_var_name in self.current_cache_vars():
+                    if len(var.child_ops) > 1 and casted_var_name in self.current_cache_vars():
                         if self.current_cache_vars()[casted_var_name].op.x != var:
                             logger.warning(
                                 "The cached cast Var doesn't match the original Var. It's due to duplicated Var "
@@ -330,7 +330,7 @@ class CastTypeQuantization(AbstractQuantizationPass):
                         Block._copy_metadata(var, x)
 
                         casted_inputs[param][i] = x
-                        if len(var._child_ops) > 1:
+                        if len(var.child_ops) > 1:
                             self.current_cache_vars()[casted_var_name] = casted_inputs[param][i]
 
             if not is_list_input:
@@ -76,7 +76,8 @@ class Var:
         None.
 
     child_ops [_child_ops]: list[Operation]
-        Ops that take this Var as an input.
+        Ops that take this Var as an input. Stored internally as a dict of
+        op -> multiplicity; the property materializes the list.
 
     nonreplaceable_vars_upstream: set[Var]
         Set that consists of nonreplaceable vars upstream
@@ -92,6 +93,7 @@ class Var:
         "consuming_blocks",
         "_nonreplaceable_vars_upstream",
         "is_descendant_of_const",
+        "_str_repr_cache",
     ]
 
     def __init__(
@@ -113,15 +115,23 @@ class Var:
         self._sym_val = sym_val
         self._op = op
         self.op_output_idx = op_output_idx
-        # An op can appear twice if it consumes a var twice (e.g.,
-        # add(%1, %1), while_loop(loop_vars=(%1, %1)).
-        self._child_ops = list()
+        # Child ops are tracked as op -> multiplicity so that add / remove are
+        # O(1) even for vars with large fan-out (e.g., a const shared by
+        # hundreds of ops). An op can consume a var more than once (e.g.,
+        # add(%1, %1), while_loop(loop_vars=(%1, %1))), which is what the
+        # multiplicity records. Insertion order is preserved so passes iterate
+        # child ops deterministically.
+        self._child_ops = dict()
 
         # A variable may not be consumed by any op (i.e. len(self._child_ops)
         # == 0) but is still used as block output. A var can be output of
         # multiple blocks (e.g., both current block and nested blocks)
         self.consuming_blocks = list()
 
+        # Cached result of Operation.var_to_str for const-backed vars; lazily
+        # populated since the const value never changes after creation.
+        self._str_repr_cache = None
+
         # replaceability
         self._nonreplaceable_vars_upstream = set()
         self._set_nonreplaceable_vars_upstream()
@@ -274,18 +284,22 @@ class Var:
 
     @property
     def child_ops(self):
-        return self._child_ops
+        return [op for op, count in self._child_ops.items() for _ in range(count)]
 
     def add_child_op(self, new_op):
-        self._child_ops.append(new_op)
+        self._child_ops[new_op] = self._child_ops.get(new_op, 0) + 1
 
     def remove_child_op(self, target_op, no_check=False):
-        if target_op not in self._child_ops:
+        count = self._child_ops.get(target_op)
+        if count is None:
             if no_check:
                 return  # no-op
             msg = "Op {} does not takes Var {} as input"
             raise ValueError(msg.format(target_op.name, self.name))
-        self._child_ops.remove(target_op)
+        if count == 1:
+            del self._child_ops[target_op]
+        else:
+            self._child_ops[target_op] = count - 1
 
     def shape_str(self):
         annotation = ""
@@ -2,10 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: LinkedModel.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -26,24 +25,8 @@ from .Parameters_pb2 import *
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11LinkedModel.proto\x12\x14\x43oreML.Specification\x1a\x10Parameters.proto\"[\n\x0bLinkedModel\x12@\n\x0flinkedModelFile\x18\x01 \x01(\x0b\x32%.CoreML.Specification.LinkedModelFileH\x00\x42\n\n\x08LinkType\"\x9b\x01\n\x0fLinkedModelFile\x12\x42\n\x13linkedModelFileName\x18\x01 \x01(\x0b\x32%.CoreML.Specification.StringParameter\x12\x44\n\x15linkedModelSearchPath\x18\x02 \x01(\x0b\x32%.CoreML.Specification.StringParameterB\x02H\x03P\x00\x62\x06proto3')
 
-
-
-_LINKEDMODEL = DESCRIPTOR.message_types_by_name['LinkedModel']
-_LINKEDMODELFILE = DESCRIPTOR.message_types_by_name['LinkedModelFile']
-LinkedModel = _reflection.GeneratedProtocolMessageType('LinkedModel', (_message.Message,), {
-  'DESCRIPTOR' : _LINKEDMODEL,
-  '__module__' : 'LinkedModel_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.LinkedModel)
-  })
-_sym_db.RegisterMessage(LinkedModel)
-
-LinkedModelFile = _reflection.GeneratedProtocolMessageType('LinkedModelFile', (_message.Message,), {
-  'DESCRIPTOR' : _LINKEDMODELFILE,
-  '__module__' : 'LinkedModel_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.LinkedModelFile)
-  })
-_sym_db.RegisterMessage(LinkedModelFile)
-
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'LinkedModel_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
@@ -2,10 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: Parameters.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -22,40 +21,8 @@ from .DataStructures_pb2 import *
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10Parameters.proto\x12\x14\x43oreML.Specification\x1a\x14\x44\x61taStructures.proto\"\x99\x01\n\x0eInt64Parameter\x12\x14\n\x0c\x64\x65\x66\x61ultValue\x18\x01 \x01(\x03\x12\x31\n\x05range\x18\n \x01(\x0b\x32 .CoreML.Specification.Int64RangeH\x00\x12-\n\x03set\x18\x0b \x01(\x0b\x32\x1e.CoreML.Specification.Int64SetH\x00\x42\x0f\n\rAllowedValues\"l\n\x0f\x44oubleParameter\x12\x14\n\x0c\x64\x65\x66\x61ultValue\x18\x01 \x01(\x01\x12\x32\n\x05range\x18\n \x01(\x0b\x32!.CoreML.Specification.DoubleRangeH\x00\x42\x0f\n\rAllowedValues\"\'\n\x0fStringParameter\x12\x14\n\x0c\x64\x65\x66\x61ultValue\x18\x01 \x01(\t\"%\n\rBoolParameter\x12\x14\n\x0c\x64\x65\x66\x61ultValue\x18\x01 \x01(\x08\x42\x02H\x03P\x00\x62\x06proto3')
 
-
-
-_INT64PARAMETER = DESCRIPTOR.message_types_by_name['Int64Parameter']
-_DOUBLEPARAMETER = DESCRIPTOR.message_types_by_name['DoubleParameter']
-_STRINGPARAMETER = DESCRIPTOR.message_types_by_name['StringParameter']
-_BOOLPARAMETER = DESCRIPTOR.message_types_by_name['BoolParameter']
-Int64Parameter = _reflection.GeneratedProtocolMessageType('Int64Parameter', (_message.Message,), {
-  'DESCRIPTOR' : _INT64PARAMETER,
-  '__module__' : 'Parameters_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.Int64Parameter)
-  })
-_sym_db.RegisterMessage(Int64Parameter)
-
-DoubleParameter = _reflection.GeneratedProtocolMessageType('DoubleParameter', (_message.Message,), {
-  'DESCRIPTOR' : _DOUBLEPARAMETER,
-  '__module__' : 'Parameters_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.DoubleParameter)
-  })
-_sym_db.RegisterMessage(DoubleParameter)
-
-StringParameter = _reflection.GeneratedProtocolMessageType('StringParameter', (_message.Message,), {
-  'DESCRIPTOR' : _STRINGPARAMETER,
-  '__module__' : 'Parameters_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.StringParameter)
-  })
-_sym_db.RegisterMessage(StringParameter)
-
-BoolParameter = _reflection.GeneratedProtocolMessageType('BoolParameter', (_message.Message,), {
-  'DESCRIPTOR' : _BOOLPARAMETER,
-  '__module__' : 'Parameters_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.BoolParameter)
-  })
-_sym_db.RegisterMessage(BoolParameter)
-
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'Parameters_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
@@ -2,10 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: WordEmbedding.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -22,16 +21,8 @@ from .DataStructures_pb2 import *
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13WordEmbedding.proto\x12!CoreML.Specification.CoreMLModels\x1a\x14\x44\x61taStructures.proto\"O\n\rWordEmbedding\x12\x10\n\x08revision\x18\x01 \x01(\r\x12\x10\n\x08language\x18\n \x01(\t\x12\x1a\n\x12modelParameterData\x18\x64 \x01(\x0c\x42\x02H\x03P\x00\x62\x06proto3')
 
-
-
-_WORDEMBEDDING = DESCRIPTOR.message_types_by_name['WordEmbedding']
-WordEmbedding = _reflection.GeneratedProtocolMessageType('WordEmbedding', (_message.Message,), {
-  'DESCRIPTOR' : _WORDEMBEDDING,
-  '__module__' : 'WordEmbedding_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.CoreMLModels.WordEmbedding)
-  })
-_sym_db.RegisterMessage(WordEmbedding)
-
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'WordEmbedding_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
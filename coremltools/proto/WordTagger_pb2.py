@@ -2,10 +2,9 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: WordTagger.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import builder as _builder
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
-from google.protobuf import message as _message
-from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
 # @@protoc_insertion_point(imports)
 
@@ -22,16 +21,8 @@ from .DataStructures_pb2 import *
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10WordTagger.proto\x12!CoreML.Specification.CoreMLModels\x1a\x14\x44\x61taStructures.proto\"\xa4\x02\n\nWordTagger\x12\x10\n\x08revision\x18\x01 \x01(\r\x12\x10\n\x08language\x18\n \x01(\t\x12\x1f\n\x17tokensOutputFeatureName\x18\x14 \x01(\t\x12\"\n\x1atokenTagsOutputFeatureName\x18\x15 \x01(\t\x12\'\n\x1ftokenLocationsOutputFeatureName\x18\x16 \x01(\t\x12%\n\x1dtokenLengthsOutputFeatureName\x18\x17 \x01(\t\x12\x1a\n\x12modelParameterData\x18\x64 \x01(\x0c\x12\x39\n\nstringTags\x18\xc8\x01 \x01(\x0b\x32\".CoreML.Specification.StringVectorH\x00\x42\x06\n\x04TagsB\x02H\x03P\x00\x62\x06proto3')
 
-
-
-_WORDTAGGER = DESCRIPTOR.message_types_by_name['WordTagger']
-WordTagger = _reflection.GeneratedProtocolMessageType('WordTagger', (_message.Message,), {
-  'DESCRIPTOR' : _WORDTAGGER,
-  '__module__' : 'WordTagger_pb2'
-  # @@protoc_insertion_point(class_scope:CoreML.Specification.CoreMLModels.WordTagger)
-  })
-_sym_db.RegisterMessage(WordTagger)
-
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, globals())
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'WordTagger_pb2', globals())
 if _descriptor._USE_C_DESCRIPTORS == False:
 
   DESCRIPTOR._options = None
@@ -1,6 +1,19 @@
 ### Module for proto generated Python code.
 
+import importlib as _importlib
 import os as _os
 
 if int(_os.environ.get("IMPORT_COREMLTOOLS_PROTO", "1")):
         from . import FeatureTypes_pb2, MIL_pb2, Model_pb2, NeuralNetwork_pb2
+
+
+def __getattr__(name):
+    # PEP 562: load *_pb2 submodules on first attribute access. The generated
+    # modules register their descriptors at import time, so loading them
+    # lazily keeps `import coremltools` from paying for proto modules that
+    # are never used.
+    if name.endswith("_pb2"):
+        module = _importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -87,7 +87,7 @@ setup(
     },
     install_requires=[
         "numpy >= 1.14.5",
-        "protobuf >= 3.1.0",
+        "protobuf >= 3.20.0",
         "sympy",
         "tqdm",
         "packaging",